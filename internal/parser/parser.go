@@ -21,6 +21,17 @@ import (
 	"gopkg.in/yaml.v3"
 )
 
+// Frontmatter delimiters. A post must open with frontmatterDelim, and the
+// frontmatter ends at the first line that starts with it. Both the checks and
+// the slicing in splitFrontmatter depend on these lengths, so they are named once.
+const (
+	frontmatterDelim    = "---"
+	frontmatterDelimEnd = "\n---"
+)
+
+// utf8BOM is the byte order mark some editors write at the start of UTF-8 files
+const utf8BOM = "\xef\xbb\xbf"
+
 // Post represents a parsed markdown post with frontmatter
 type Post struct {
 	Title       string
@@ -115,7 +126,7 @@ func (p *Parser) ParseFile(path string) (*Post, error) {
 //	Markdown content here...
 //
 // Process:
-//  1. Splits content on "---" delimiters to extract frontmatter
+//  1. Splits off the frontmatter between the opening and closing "---" lines
 //  2. Parses YAML frontmatter into structured data
 //  3. Converts markdown to HTML using goldmark (with GFM, footnotes, etc.)
 //  4. Generates a URL-friendly slug from the filename
@@ -128,20 +139,23 @@ func (p *Parser) ParseFile(path string) (*Post, error) {
 // Returns a Post struct or an error if parsing fails.
 func (p *Parser) Parse(content []byte, path string) (*Post, error) {
 	// Split frontmatter and content
-	parts := bytes.SplitN(content, []byte("---"), 3)
-	if len(parts) < 3 {
+	frontmatter, body, ok := splitFrontmatter(content)
+	if !ok {
 		return nil, fmt.Errorf("invalid frontmatter format")
 	}
 
 	// Parse frontmatter
 	var fm Frontmatter
-	if err := yaml.Unmarshal(parts[1], &fm); err != nil {
+	if err := yaml.Unmarshal(frontmatter, &fm); err != nil {
 		return nil, fmt.Errorf("parsing frontmatter: %w", err)
 	}
 
 	// Parse markdown content
 	var buf bytes.Buffer
-	markdown := bytes.TrimSpace(parts[2])
+	markdown := bytes.TrimSpace(body)
+	// Rendered HTML is usually at least as long as its source, so size the
+	// buffer up front instead of letting it grow repeatedly during conversion
+	buf.Grow(len(markdown))
 	if err := p.md.Convert(markdown, &buf); err != nil {
 		return nil, fmt.Errorf("converting markdown: %w", err)
 	}
@@ -166,6 +180,38 @@ func (p *Parser) Parse(content []byte, path string) (*Post, error) {
 	return post, nil
 }
 
+// splitFrontmatter separates the YAML frontmatter from the markdown body.
+//
+// A leading UTF-8 byte order mark and whitespace are skipped. Content that
+// doesn't then start with "---" is rejected with a single prefix check, without
+// scanning the rest of the file. Otherwise the frontmatter runs up to the
+// next line starting with "---", so the delimiter may appear inside frontmatter
+// values or the markdown body.
+//
+// Parameters:
+//   - content: Raw file content as bytes
+//
+// Returns the frontmatter and body slices of content, and false if either
+// delimiter is missing.
+func splitFrontmatter(content []byte) (frontmatter, body []byte, ok bool) {
+	// Editors may save a UTF-8 byte order mark or blank lines before the
+	// opening delimiter
+	content = bytes.TrimPrefix(content, []byte(utf8BOM))
+	content = bytes.TrimLeft(content, " \t\r\n")
+
+	if !bytes.HasPrefix(content, []byte(frontmatterDelim)) {
+		return nil, nil, false
+	}
+
+	rest := content[len(frontmatterDelim):]
+	end := bytes.Index(rest, []byte(frontmatterDelimEnd))
+	if end < 0 {
+		return nil, nil, false
+	}
+
+	return rest[:end], rest[end+len(frontmatterDelimEnd):], true
+}
+
 // generateSlug creates a URL-friendly slug from a file path. It extracts the
 // filename, removes the extension, and strips the date prefix if present.
 //
@@ -135,6 +135,14 @@ func TestParse_InvalidFrontmatter(t *testing.T) {
 			name:    "single delimiter only",
 			content: "---\ntitle: Test\n",
 		},
+		{
+			name:    "scalar tags",
+			content: "---\ntitle: Test\ntags: go\n---\nContent",
+		},
+		{
+			name:    "text before opening delimiter",
+			content: "Intro\n---\ntitle: Test\n---\nContent",
+		},
 		{
 			name: "invalid YAML",
 			content: `---
@@ -156,6 +164,73 @@ Content`,
 	}
 }
 
+// TestParse_LeadingBOMAndWhitespace tests that a byte order mark or blank lines
+// before the opening delimiter are accepted
+func TestParse_LeadingBOMAndWhitespace(t *testing.T) {
+	frontmatter := "---\ntitle: Test\ndate: 2024-01-15T10:00:00Z\n---\nContent"
+	tests := []struct {
+		name    string
+		content string
+	}{
+		{
+			name:    "UTF-8 BOM",
+			content: "\xef\xbb\xbf" + frontmatter,
+		},
+		{
+			name:    "leading blank line",
+			content: "\n" + frontmatter,
+		},
+		{
+			name:    "BOM and CRLF blank line",
+			content: "\xef\xbb\xbf\r\n" + frontmatter,
+		},
+	}
+
+	p := New()
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			post, err := p.Parse([]byte(tt.content), "test.md")
+			if err != nil {
+				t.Fatalf("Parse() failed: %v", err)
+			}
+
+			if post.Title != "Test" {
+				t.Errorf("Title = %q, want %q", post.Title, "Test")
+			}
+		})
+	}
+}
+
+// TestParse_DelimiterInContent tests that "---" inside frontmatter values and the
+// markdown body doesn't split the post early
+func TestParse_DelimiterInContent(t *testing.T) {
+	p := New()
+	content := []byte(`---
+title: Before --- After
+date: 2024-01-15T10:00:00Z
+---
+
+Above the rule
+
+---
+
+Below the rule
+`)
+
+	post, err := p.Parse(content, "delimiters.md")
+	if err != nil {
+		t.Fatalf("Parse() failed: %v", err)
+	}
+
+	if post.Title != "Before --- After" {
+		t.Errorf("Title = %q, want %q", post.Title, "Before --- After")
+	}
+
+	if !strings.Contains(post.RawContent, "Below the rule") {
+		t.Errorf("RawContent doesn't contain text after the horizontal rule")
+	}
+}
+
 // TestParse_EmptyTags tests parsing with no tags
 func TestParse_EmptyTags(t *testing.T) {
 	p := New()
@@ -324,6 +399,10 @@ func TestGenerateSlug(t *testing.T) {
 			path: "no-extension",
 			want: "no-extension",
 		},
+		{
+			path: "2024-01-15-notes.md.backup.md",
+			want: "notes.md.backup",
+		},
 	}
 
 	for _, tt := range tests {
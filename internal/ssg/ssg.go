@@ -3,14 +3,24 @@
 package ssg
 
 import (
+	"bufio"
+	"crypto/sha256"
+	"encoding/hex"
+	"encoding/json"
+	"errors"
 	"fmt"
 	"html/template"
+	"io"
+	"io/fs"
 	"log/slog"
 	"net/http"
 	"os"
 	"path/filepath"
+	"runtime"
+	"runtime/debug"
 	"sort"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/kvnloughead/ssg/internal/parser"
@@ -29,6 +39,38 @@ type SiteConfig struct {
 // Renderer handles template rendering
 type Renderer struct {
 	templates *template.Template
+	dir       string
+	pages     map[string]*template.Template // base.html + content template, by content template name
+}
+
+// postCacheFile is where Build keeps parsed posts between runs. It lives outside
+// the output directory, which is removed on every build.
+const postCacheFile = ".ssg-cache.json"
+
+// postCacheVersion must be bumped whenever the on-disk cache format changes.
+// Changes to parser output are detected separately by parserFingerprint.
+const postCacheVersion = 2
+
+// postCache holds the last parsed result of each markdown file, along with the
+// fingerprint of the binary that produced them
+type postCache struct {
+	fingerprint string
+	entries     map[string]cachedPost // keyed by file path
+	dirty       bool                  // entries differ from the cache file on disk
+}
+
+// cachedPost is a parsed post along with the file state it was parsed from
+type cachedPost struct {
+	ModTime int64        `json:"modTime"` // Modification time in Unix nanoseconds
+	Size    int64        `json:"size"`
+	Post    *parser.Post `json:"post"`
+}
+
+// postCacheData is the on-disk format of a postCache
+type postCacheData struct {
+	Version     int                   `json:"version"`
+	Fingerprint string                `json:"fingerprint"`
+	Posts       map[string]cachedPost `json:"posts"`
 }
 
 // PageData holds data passed to templates
@@ -44,7 +86,8 @@ type PageData struct {
 // Flow:
 //  1. Loads site configuration from config.yaml (title, author, etc.)
 //  2. Creates a parser instance to handle markdown conversion
-//  3. Parses all markdown files in content/posts/ using parser.ParseFile
+//  3. Parses all markdown files in content/posts/ using parser.ParseFile, skipping
+//     files that are unchanged since the last build (see postCache)
 //  4. Filters out draft posts and sorts by date (newest first)
 //  5. Creates a renderer instance with templates from templates/
 //  6. Renders posts.html with the list of posts using renderer.renderIndex
@@ -66,11 +109,24 @@ func Build(configPath, outputDir string) error {
 	// Create parser
 	p := parser.New()
 
-	// Parse all posts
-	posts, err := parseAllPosts(p, "content/posts")
+	// Parse all posts, reusing cached results for unchanged files. Without a
+	// fingerprint there is no way to tell whether cached output is stale, so
+	// every post is parsed.
+	var cache *postCache
+	if fingerprint, ok := parserFingerprint(); ok {
+		cache = loadPostCache(postCacheFile, fingerprint)
+	}
+	posts, err := parseAllPosts(p, "content/posts", cache)
 	if err != nil {
 		return fmt.Errorf("parsing posts: %w", err)
 	}
+	// Like loading, saving the cache is only an optimization, so a failure (e.g.,
+	// a read-only checkout) shouldn't fail the build
+	if cache != nil && cache.dirty {
+		if err := cache.save(postCacheFile); err != nil {
+			slog.Warn("saving post cache", "path", postCacheFile, "err", err)
+		}
+	}
 
 	// Filter out drafts
 	publishedPosts := filterDrafts(posts)
@@ -168,17 +224,19 @@ func Serve(port string) error {
 //
 // Returns an error if file creation fails.
 func NewPost(title string) error {
-	// Create slug from title
-	slug := strings.ToLower(title)
-	slug = strings.ReplaceAll(slug, " ", "-")
-	// Remove non-alphanumeric characters except hyphens
+	// Create slug from title in a single pass: spaces become hyphens and other
+	// non-alphanumeric characters except hyphens are removed
 	var cleanSlug strings.Builder
-	for _, r := range slug {
-		if (r >= 'a' && r <= 'z') || (r >= '0' && r <= '9') || r == '-' {
+	cleanSlug.Grow(len(title))
+	for _, r := range strings.ToLower(title) {
+		switch {
+		case r == ' ':
+			cleanSlug.WriteByte('-')
+		case (r >= 'a' && r <= 'z') || (r >= '0' && r <= '9') || r == '-':
 			cleanSlug.WriteRune(r)
 		}
 	}
-	slug = cleanSlug.String()
+	slug := cleanSlug.String()
 
 	// Create filename with date
 	date := time.Now().Format("2006-01-02")
@@ -228,7 +286,11 @@ func newRenderer(templateDir string) (*Renderer, error) {
 		return nil, fmt.Errorf("loading templates: %w", err)
 	}
 
-	return &Renderer{templates: tmpl}, nil
+	return &Renderer{
+		templates: tmpl,
+		dir:       templateDir,
+		pages:     make(map[string]*template.Template),
+	}, nil
 }
 
 // renderPost renders a single blog post page to an HTML file.
@@ -278,12 +340,11 @@ func (r *Renderer) renderIndex(posts []*parser.Post, config SiteConfig, outputPa
 // renderToFile renders a page by combining base.html with a content template.
 //
 // This is where the template inheritance pattern is implemented:
-//  1. Clones the pre-loaded base.html template (for a fresh copy)
-//  2. Parses the content template file (posts.html or post.html) which contains
-//     a {{define "posts"}} block
-//  3. Executes base.html, which calls {{template "posts" .}} to inject the
+//  1. Gets base.html combined with the content template (posts.html or
+//     post.html), which contains a {{define "posts"}} block, from r.page
+//  2. Executes base.html, which calls {{template "posts" .}} to inject the
 //     appropriate content block
-//  4. Writes the final HTML to the output file
+//  3. Streams the final HTML to the output file through a buffered writer
 //
 // This allows index and post pages to share the same header/footer/nav from base.html
 // while having different main content.
@@ -308,24 +369,55 @@ func (r *Renderer) renderToFile(contentTemplate string, data PageData, outputPat
 	}
 	defer f.Close()
 
-	// Parse base.html with the specific content template
-	tmpl, err := r.templates.Lookup("base.html").Clone()
+	tmpl, err := r.page(contentTemplate)
 	if err != nil {
-		return fmt.Errorf("cloning base template: %w", err)
+		return err
 	}
 
-	// Add the specific content template
-	if _, err := tmpl.ParseFiles(filepath.Join("templates", contentTemplate)); err != nil {
-		return fmt.Errorf("parsing content template: %w", err)
-	}
-
-	if err := tmpl.Execute(f, data); err != nil {
+	// Template execution issues many small writes, so buffer them rather than
+	// making a syscall for each one
+	w := bufio.NewWriter(f)
+	if err := tmpl.Execute(w, data); err != nil {
 		return fmt.Errorf("executing template: %w", err)
 	}
+	if err := w.Flush(); err != nil {
+		return fmt.Errorf("writing output file: %w", err)
+	}
 
 	return nil
 }
 
+// page returns base.html combined with the given content template.
+//
+// The combination is built once per content template, by cloning the pre-loaded
+// base.html and parsing the content template file from the template directory,
+// and cached on the Renderer. Rendering every post page therefore reuses a single
+// parsed template instead of re-reading and re-parsing post.html for each post.
+//
+// Parameters:
+//   - contentTemplate: Which content template to use ("posts.html" or "post.html")
+//
+// Returns the combined template or an error if cloning or parsing fails.
+func (r *Renderer) page(contentTemplate string) (*template.Template, error) {
+	if tmpl, ok := r.pages[contentTemplate]; ok {
+		return tmpl, nil
+	}
+
+	// Clone base.html for a fresh copy
+	tmpl, err := r.templates.Lookup("base.html").Clone()
+	if err != nil {
+		return nil, fmt.Errorf("cloning base template: %w", err)
+	}
+
+	// Add the specific content template
+	if _, err := tmpl.ParseFiles(filepath.Join(r.dir, contentTemplate)); err != nil {
+		return nil, fmt.Errorf("parsing content template: %w", err)
+	}
+
+	r.pages[contentTemplate] = tmpl
+	return tmpl, nil
+}
+
 // loadConfig loads the site configuration from YAML
 func loadConfig(path string) (*SiteConfig, error) {
 	data, err := os.ReadFile(path)
@@ -343,18 +435,25 @@ func loadConfig(path string) (*SiteConfig, error) {
 
 // parseAllPosts parses all markdown files in a directory using the provided parser.
 //
-// Scans the directory for .md files and calls parser.ParseFile on each one.
+// Scans the directory and its subdirectories for .md files and calls
+// parser.ParseFile on each one. dir itself may be a symlink to a directory. Files whose modification time and size match
+// their entry in cache are taken from the cache instead of being re-parsed. The
+// remaining files are independent, so they are parsed concurrently by a pool of
+// runtime.NumCPU() workers. Results keep the directory listing order.
 // Returns an empty slice if the directory doesn't exist (not an error).
 //
 // Parameters:
 //   - p: Parser instance to use for markdown conversion
 //   - dir: Directory path containing markdown files (e.g., "content/posts")
+//   - cache: Previously parsed posts, updated in place with the results; nil disables caching
 //
-// Returns a slice of parsed Post structs or an error if parsing fails.
-func parseAllPosts(p *parser.Parser, dir string) ([]*parser.Post, error) {
+// Returns a slice of parsed Post structs, or an error if parsing fails or two
+// posts share a slug.
+func parseAllPosts(p *parser.Parser, dir string, cache *postCache) ([]*parser.Post, error) {
 	var posts []*parser.Post
 
-	entries, err := os.ReadDir(dir)
+	// WalkDir doesn't follow a symlinked root, so resolve it first
+	root, err := filepath.EvalSymlinks(dir)
 	if err != nil {
 		// If directory doesn't exist, return empty slice
 		if os.IsNotExist(err) {
@@ -363,23 +462,223 @@ func parseAllPosts(p *parser.Parser, dir string) ([]*parser.Post, error) {
 		return nil, err
 	}
 
-	for _, entry := range entries {
-		if entry.IsDir() || !strings.HasSuffix(entry.Name(), ".md") {
-			continue
+	// WalkDir hands back directory entries as read, so filtering on the name
+	// and type needs no extra stat call per file. Paths are reported under dir
+	// rather than the resolved root.
+	var paths []string
+	err = filepath.WalkDir(root, func(path string, d fs.DirEntry, err error) error {
+		if err != nil {
+			return err
+		}
+		if d.IsDir() || !strings.HasSuffix(d.Name(), ".md") {
+			return nil
+		}
+
+		rel, err := filepath.Rel(root, path)
+		if err != nil {
+			return err
+		}
+		paths = append(paths, filepath.Join(dir, rel))
+		return nil
+	})
+	if err != nil {
+		return nil, err
+	}
+
+	posts = make([]*parser.Post, len(paths))
+	errs := make([]error, len(paths))
+
+	// Only files that changed since the last build need parsing
+	var stale []int
+	var infos []os.FileInfo
+	if cache != nil {
+		infos = make([]os.FileInfo, len(paths))
+	}
+	for i, path := range paths {
+		if cache != nil {
+			info, err := os.Stat(path)
+			if err != nil {
+				return nil, fmt.Errorf("stat %s: %w", path, err)
+			}
+			infos[i] = info
+			if post, ok := cache.lookup(path, info); ok {
+				posts[i] = post
+				continue
+			}
 		}
+		stale = append(stale, i)
+	}
+
+	// Feed indices to the workers so each result lands in its original slot
+	jobs := make(chan int)
+	var wg sync.WaitGroup
+	for w := 0; w < min(runtime.NumCPU(), len(stale)); w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for i := range jobs {
+				posts[i], errs[i] = p.ParseFile(paths[i])
+			}
+		}()
+	}
+	for _, i := range stale {
+		jobs <- i
+	}
+	close(jobs)
+	wg.Wait()
 
-		path := filepath.Join(dir, entry.Name())
-		post, err := p.ParseFile(path)
+	for i, err := range errs {
 		if err != nil {
-			return nil, fmt.Errorf("parsing %s: %w", path, err)
+			return nil, fmt.Errorf("parsing %s: %w", paths[i], err)
 		}
+	}
 
-		posts = append(posts, post)
+	// Slugs come from the file name alone, so posts in different subdirectories
+	// can collide and would silently overwrite each other's page
+	seen := make(map[string]string, len(posts))
+	for i, post := range posts {
+		if prev, ok := seen[post.Slug]; ok {
+			return nil, fmt.Errorf("duplicate slug %q: %s and %s", post.Slug, prev, paths[i])
+		}
+		seen[post.Slug] = paths[i]
+	}
+
+	if cache != nil {
+		cache.update(paths, infos, posts, len(stale))
 	}
 
 	return posts, nil
 }
 
+// parserFingerprint identifies the build of ssg that is producing posts.
+//
+// Cached posts depend not only on their source files but on the code that parsed
+// them: goldmark options in parser.New, the Post fields, generateSlug, and the
+// goldmark, goldmark-highlighting and chroma versions in go.mod. All of these are
+// compiled into the running executable, so the fingerprint combines the
+// executable's path, size and modification time, which change whenever it is
+// rebuilt (including air rebuilding an already-dirty checkout), with the module
+// versions and VCS stamp from the build info. Only metadata is read, so the cost
+// doesn't grow with the size of the binary.
+//
+// Returns the hex-encoded fingerprint, or false if the executable can't be found.
+func parserFingerprint() (string, bool) {
+	exe, err := os.Executable()
+	if err != nil {
+		return "", false
+	}
+
+	info, err := os.Stat(exe)
+	if err != nil {
+		return "", false
+	}
+
+	h := sha256.New()
+	fmt.Fprintf(h, "%s %d %d\n", exe, info.Size(), info.ModTime().UnixNano())
+	if build, ok := debug.ReadBuildInfo(); ok {
+		fmt.Fprintf(h, "%s %s@%s\n", build.GoVersion, build.Main.Path, build.Main.Version)
+		for _, setting := range build.Settings {
+			if strings.HasPrefix(setting.Key, "vcs.") {
+				fmt.Fprintf(h, "%s=%s\n", setting.Key, setting.Value)
+			}
+		}
+		for _, dep := range build.Deps {
+			fmt.Fprintf(h, "%s@%s %s\n", dep.Path, dep.Version, dep.Sum)
+		}
+	}
+
+	return hex.EncodeToString(h.Sum(nil)), true
+}
+
+// loadPostCache reads the post cache written by a previous build.
+//
+// The cache is only an optimization, so a missing, unreadable, or outdated cache
+// file yields an empty cache rather than an error. A cache written by a build
+// with a different fingerprint is discarded as well, since its posts may have
+// been rendered differently.
+//
+// Parameters:
+//   - path: Path to the cache file (e.g., ".ssg-cache.json")
+//   - fingerprint: Fingerprint of the current build, from parserFingerprint
+//
+// Returns the cache, which is saved with fingerprint.
+func loadPostCache(path, fingerprint string) *postCache {
+	cache := &postCache{
+		fingerprint: fingerprint,
+		entries:     make(map[string]cachedPost),
+	}
+
+	data, err := os.ReadFile(path)
+	if err != nil {
+		return cache
+	}
+
+	var cached postCacheData
+	if err := json.Unmarshal(data, &cached); err != nil {
+		return cache
+	}
+	if cached.Version != postCacheVersion || cached.Fingerprint != fingerprint || cached.Posts == nil {
+		return cache
+	}
+
+	cache.entries = cached.Posts
+	return cache
+}
+
+// lookup returns the cached post for path if the file's modification time and
+// size still match the ones it was parsed from.
+func (c *postCache) lookup(path string, info os.FileInfo) (*parser.Post, bool) {
+	entry, ok := c.entries[path]
+	if !ok || entry.Post == nil || entry.ModTime != info.ModTime().UnixNano() || entry.Size != info.Size() {
+		return nil, false
+	}
+	return entry.Post, true
+}
+
+// update replaces the cache contents with the given parse results, dropping
+// entries for files that no longer exist. The cache is marked dirty, so that
+// Build saves it, only if reparsed is non-zero or a file was removed. Every path
+// that wasn't re-parsed was a cache hit, so with nothing re-parsed the entries
+// are a superset of paths and equal lengths mean nothing was removed.
+func (c *postCache) update(paths []string, infos []os.FileInfo, posts []*parser.Post, reparsed int) {
+	if reparsed > 0 || len(c.entries) != len(paths) {
+		c.dirty = true
+	}
+
+	clear(c.entries)
+	for i, path := range paths {
+		c.entries[path] = cachedPost{
+			ModTime: infos[i].ModTime().UnixNano(),
+			Size:    infos[i].Size(),
+			Post:    posts[i],
+		}
+	}
+}
+
+// save writes the cache to disk for the next build.
+//
+// Parameters:
+//   - path: Path to the cache file (e.g., ".ssg-cache.json")
+//
+// Returns an error if encoding or writing the file fails.
+func (c *postCache) save(path string) error {
+	data, err := json.Marshal(postCacheData{
+		Version:     postCacheVersion,
+		Fingerprint: c.fingerprint,
+		Posts:       c.entries,
+	})
+	if err != nil {
+		return err
+	}
+
+	if err := os.WriteFile(path, data, 0600); err != nil {
+		return err
+	}
+
+	c.dirty = false
+	return nil
+}
+
 // filterDrafts removes draft posts from the list based on the "draft" frontmatter field.
 //
 // Posts with draft: true in their frontmatter are excluded from the published site.
@@ -389,7 +688,7 @@ func parseAllPosts(p *parser.Parser, dir string) ([]*parser.Post, error) {
 //
 // Returns a new slice containing only non-draft posts.
 func filterDrafts(posts []*parser.Post) []*parser.Post {
-	var published []*parser.Post
+	published := make([]*parser.Post, 0, len(posts))
 	for _, post := range posts {
 		if !post.Draft {
 			published = append(published, post)
@@ -435,11 +734,39 @@ func copyStatic(srcDir, dstDir string) error {
 		}
 
 		// Copy file
-		data, err := os.ReadFile(path)
-		if err != nil {
-			return err
-		}
-
-		return os.WriteFile(dstPath, data, info.Mode())
+		return copyFile(path, dstPath, info.Mode())
 	})
 }
+
+// copyFile streams a single file from src to dst, creating or truncating dst
+// with the given permissions.
+//
+// Both ends are *os.File, so io.Copy hands the copy to (*os.File).ReadFrom, which
+// on Linux uses copy_file_range/sendfile and never moves the bytes through user
+// space. Other platforms fall back to a fixed-size buffer. Either way, memory use
+// stays constant regardless of file size (large images, fonts, etc.).
+//
+// Parameters:
+//   - src: Path of the file to copy
+//   - dst: Path to write the copy to
+//   - mode: Permissions for dst if it is created
+//
+// Returns an error if opening, copying, or closing either file fails.
+func copyFile(src, dst string, mode os.FileMode) error {
+	in, err := os.Open(src)
+	if err != nil {
+		return err
+	}
+	defer in.Close()
+
+	out, err := os.OpenFile(dst, os.O_WRONLY|os.O_CREATE|os.O_TRUNC, mode)
+	if err != nil {
+		return err
+	}
+
+	if _, err := io.Copy(out, in); err != nil {
+		return errors.Join(err, out.Close())
+	}
+
+	return out.Close()
+}
@@ -1,8 +1,10 @@
 package ssg
 
 import (
+	"fmt"
 	"os"
 	"path/filepath"
+	"runtime"
 	"strings"
 	"testing"
 	"time"
@@ -158,6 +160,18 @@ Draft content.
 	if strings.Contains(string(indexHTML), "Draft Post") {
 		t.Error("Index page contains draft post (should be excluded)")
 	}
+
+	// The post cache is only an optimization: a cache file that can't be
+	// written must not fail the build
+	if err := os.Remove(postCacheFile); err != nil {
+		t.Fatal(err)
+	}
+	if err := os.Mkdir(postCacheFile, 0750); err != nil {
+		t.Fatal(err)
+	}
+	if err := Build(configPath, outputDir); err != nil {
+		t.Fatalf("Build() with unwritable post cache failed: %v", err)
+	}
 }
 
 // TestNewPost tests creating a new post
@@ -340,7 +354,7 @@ Content 3`,
 	}
 
 	p := parser.New()
-	parsed, err := parseAllPosts(p, postsDir)
+	parsed, err := parseAllPosts(p, postsDir, nil)
 	if err != nil {
 		t.Fatalf("parseAllPosts() failed: %v", err)
 	}
@@ -350,6 +364,282 @@ Content 3`,
 	}
 }
 
+// TestParseAllPosts_Order tests that concurrent parsing keeps the directory
+// listing order when there are more posts than workers
+func TestParseAllPosts_Order(t *testing.T) {
+	tmpDir := t.TempDir()
+	postsDir := filepath.Join(tmpDir, "posts")
+	if err := os.MkdirAll(postsDir, 0750); err != nil {
+		t.Fatal(err)
+	}
+
+	n := 2*runtime.NumCPU() + 3
+	var want []string
+	for i := 0; i < n; i++ {
+		slug := fmt.Sprintf("post-%03d", i)
+		want = append(want, slug)
+
+		content := fmt.Sprintf("---\ntitle: Post %d\ndate: 2024-01-15T10:00:00Z\n---\nContent %d", i, i)
+		path := filepath.Join(postsDir, "2024-01-15-"+slug+".md")
+		if err := os.WriteFile(path, []byte(content), 0600); err != nil {
+			t.Fatal(err)
+		}
+	}
+
+	p := parser.New()
+	parsed, err := parseAllPosts(p, postsDir, nil)
+	if err != nil {
+		t.Fatalf("parseAllPosts() failed: %v", err)
+	}
+
+	if len(parsed) != n {
+		t.Fatalf("len(parsed) = %d, want %d", len(parsed), n)
+	}
+
+	for i, post := range parsed {
+		if post.Slug != want[i] {
+			t.Errorf("parsed[%d].Slug = %q, want %q", i, post.Slug, want[i])
+		}
+	}
+}
+
+// TestParseAllPosts_NestedDirectory tests that posts in subdirectories are found
+func TestParseAllPosts_NestedDirectory(t *testing.T) {
+	tmpDir := t.TempDir()
+	nestedDir := filepath.Join(tmpDir, "posts", "2024")
+	if err := os.MkdirAll(nestedDir, 0750); err != nil {
+		t.Fatal(err)
+	}
+
+	content := `---
+title: Nested Post
+date: 2024-01-15T10:00:00Z
+draft: false
+---
+Nested content`
+	if err := os.WriteFile(filepath.Join(nestedDir, "2024-01-15-nested.md"), []byte(content), 0600); err != nil {
+		t.Fatal(err)
+	}
+
+	p := parser.New()
+	parsed, err := parseAllPosts(p, filepath.Join(tmpDir, "posts"), nil)
+	if err != nil {
+		t.Fatalf("parseAllPosts() failed: %v", err)
+	}
+
+	if len(parsed) != 1 {
+		t.Fatalf("len(parsed) = %d, want 1", len(parsed))
+	}
+
+	if parsed[0].Slug != "nested" {
+		t.Errorf("Slug = %q, want %q", parsed[0].Slug, "nested")
+	}
+}
+
+// TestParseAllPosts_SymlinkedDirectory tests that a posts directory which is a
+// symlink to a directory is followed
+func TestParseAllPosts_SymlinkedDirectory(t *testing.T) {
+	tmpDir := t.TempDir()
+	realDir := filepath.Join(tmpDir, "real-posts")
+	if err := os.MkdirAll(realDir, 0750); err != nil {
+		t.Fatal(err)
+	}
+
+	content := `---
+title: Linked Post
+date: 2024-01-15T10:00:00Z
+---
+Linked content`
+	if err := os.WriteFile(filepath.Join(realDir, "2024-01-15-linked.md"), []byte(content), 0600); err != nil {
+		t.Fatal(err)
+	}
+
+	postsDir := filepath.Join(tmpDir, "posts")
+	if err := os.Symlink(realDir, postsDir); err != nil {
+		t.Skipf("symlinks not supported: %v", err)
+	}
+
+	p := parser.New()
+	parsed, err := parseAllPosts(p, postsDir, nil)
+	if err != nil {
+		t.Fatalf("parseAllPosts() failed: %v", err)
+	}
+
+	if len(parsed) != 1 {
+		t.Fatalf("len(parsed) = %d, want 1", len(parsed))
+	}
+
+	if parsed[0].Slug != "linked" {
+		t.Errorf("Slug = %q, want %q", parsed[0].Slug, "linked")
+	}
+}
+
+// TestParseAllPosts_DuplicateSlug tests that posts in different subdirectories
+// with the same slug are rejected rather than overwriting each other
+func TestParseAllPosts_DuplicateSlug(t *testing.T) {
+	tmpDir := t.TempDir()
+	postsDir := filepath.Join(tmpDir, "posts")
+
+	content := `---
+title: Intro
+date: 2024-01-15T10:00:00Z
+---
+Content`
+	for _, year := range []string{"2024", "2025"} {
+		dir := filepath.Join(postsDir, year)
+		if err := os.MkdirAll(dir, 0750); err != nil {
+			t.Fatal(err)
+		}
+		if err := os.WriteFile(filepath.Join(dir, "intro.md"), []byte(content), 0600); err != nil {
+			t.Fatal(err)
+		}
+	}
+
+	p := parser.New()
+	_, err := parseAllPosts(p, postsDir, nil)
+	if err == nil {
+		t.Fatal("parseAllPosts() succeeded, want duplicate slug error")
+	}
+
+	if !strings.Contains(err.Error(), `duplicate slug "intro"`) {
+		t.Errorf("error = %v, want duplicate slug error", err)
+	}
+}
+
+// TestParseAllPosts_Cache tests that unchanged files are served from the post cache
+func TestParseAllPosts_Cache(t *testing.T) {
+	tmpDir := t.TempDir()
+	postsDir := filepath.Join(tmpDir, "posts")
+	if err := os.MkdirAll(postsDir, 0750); err != nil {
+		t.Fatal(err)
+	}
+
+	path := filepath.Join(postsDir, "2024-01-15-cached.md")
+	writePost := func(title string, modTime time.Time) {
+		content := "---\ntitle: " + title + "\ndate: 2024-01-15T10:00:00Z\n---\nContent"
+		if err := os.WriteFile(path, []byte(content), 0600); err != nil {
+			t.Fatal(err)
+		}
+		if err := os.Chtimes(path, modTime, modTime); err != nil {
+			t.Fatal(err)
+		}
+	}
+
+	modTime := time.Date(2024, 1, 15, 10, 0, 0, 0, time.UTC)
+	writePost("Original", modTime)
+
+	p := parser.New()
+	cachePath := filepath.Join(tmpDir, postCacheFile)
+	cache := loadPostCache(cachePath, "build-a")
+	if _, err := parseAllPosts(p, postsDir, cache); err != nil {
+		t.Fatalf("parseAllPosts() failed: %v", err)
+	}
+	if !cache.dirty {
+		t.Error("cache not dirty after parsing a new file")
+	}
+	if err := cache.save(cachePath); err != nil {
+		t.Fatalf("save() failed: %v", err)
+	}
+
+	// Same size and modification time: the cached post should be used
+	writePost("Modified", modTime)
+	cache = loadPostCache(cachePath, "build-a")
+	parsed, err := parseAllPosts(p, postsDir, cache)
+	if err != nil {
+		t.Fatalf("parseAllPosts() failed: %v", err)
+	}
+	if parsed[0].Title != "Original" {
+		t.Errorf("Title = %q, want cached %q", parsed[0].Title, "Original")
+	}
+	if cache.dirty {
+		t.Error("cache dirty with no changed files, want no save needed")
+	}
+
+	// New modification time: the file should be re-parsed
+	writePost("Modified", modTime.Add(time.Hour))
+	parsed, err = parseAllPosts(p, postsDir, cache)
+	if err != nil {
+		t.Fatalf("parseAllPosts() failed: %v", err)
+	}
+	if parsed[0].Title != "Modified" {
+		t.Errorf("Title = %q, want %q", parsed[0].Title, "Modified")
+	}
+	if !cache.dirty {
+		t.Error("cache not dirty after re-parsing a changed file")
+	}
+
+	// Same file state but a cache written by a different build: the cache must
+	// be discarded and the file re-parsed
+	if err := cache.save(cachePath); err != nil {
+		t.Fatalf("save() failed: %v", err)
+	}
+	writePost("Rebuilt!", modTime.Add(time.Hour))
+	cache = loadPostCache(cachePath, "build-b")
+	if len(cache.entries) != 0 {
+		t.Errorf("loadPostCache() has %d entries for mismatched fingerprint, want 0", len(cache.entries))
+	}
+	parsed, err = parseAllPosts(p, postsDir, cache)
+	if err != nil {
+		t.Fatalf("parseAllPosts() failed: %v", err)
+	}
+	if parsed[0].Title != "Rebuilt!" {
+		t.Errorf("Title = %q, want re-parsed %q", parsed[0].Title, "Rebuilt!")
+	}
+
+	// Removing a file must also mark the cache for saving
+	if err := cache.save(cachePath); err != nil {
+		t.Fatalf("save() failed: %v", err)
+	}
+	if err := os.Remove(path); err != nil {
+		t.Fatal(err)
+	}
+	if _, err := parseAllPosts(p, postsDir, cache); err != nil {
+		t.Fatalf("parseAllPosts() failed: %v", err)
+	}
+	if !cache.dirty || len(cache.entries) != 0 {
+		t.Errorf("after removal: dirty = %v, len(entries) = %d, want true, 0", cache.dirty, len(cache.entries))
+	}
+}
+
+// TestLoadPostCache_Invalid tests that unusable cache files yield an empty cache
+func TestLoadPostCache_Invalid(t *testing.T) {
+	tmpDir := t.TempDir()
+
+	files := map[string]string{
+		"corrupt.json":  "not json",
+		"outdated.json": `{"version": 0, "fingerprint": "build-a", "posts": {"a.md": {"modTime": 1, "size": 1, "post": {}}}}`,
+	}
+
+	for name, content := range files {
+		path := filepath.Join(tmpDir, name)
+		if err := os.WriteFile(path, []byte(content), 0600); err != nil {
+			t.Fatal(err)
+		}
+
+		if cache := loadPostCache(path, "build-a"); len(cache.entries) != 0 {
+			t.Errorf("loadPostCache(%s) has %d entries, want 0", name, len(cache.entries))
+		}
+	}
+
+	if cache := loadPostCache(filepath.Join(tmpDir, "missing.json"), "build-a"); len(cache.entries) != 0 {
+		t.Error("loadPostCache() for missing file should return an empty cache")
+	}
+}
+
+// TestParserFingerprint tests that the running executable can be fingerprinted
+// and that the fingerprint is stable within a build
+func TestParserFingerprint(t *testing.T) {
+	first, ok := parserFingerprint()
+	if !ok || first == "" {
+		t.Fatal("parserFingerprint() failed for the test binary")
+	}
+
+	second, _ := parserFingerprint()
+	if first != second {
+		t.Errorf("parserFingerprint() = %q, then %q, want stable", first, second)
+	}
+}
+
 // TestParseAllPosts_EmptyDirectory tests parsing an empty directory
 func TestParseAllPosts_EmptyDirectory(t *testing.T) {
 	tmpDir := t.TempDir()
@@ -359,7 +649,7 @@ func TestParseAllPosts_EmptyDirectory(t *testing.T) {
 	}
 
 	p := parser.New()
-	parsed, err := parseAllPosts(p, postsDir)
+	parsed, err := parseAllPosts(p, postsDir, nil)
 	if err != nil {
 		t.Fatalf("parseAllPosts() failed: %v", err)
 	}
@@ -372,7 +662,7 @@ func TestParseAllPosts_EmptyDirectory(t *testing.T) {
 // TestParseAllPosts_NonExistentDirectory tests parsing a non-existent directory
 func TestParseAllPosts_NonExistentDirectory(t *testing.T) {
 	p := parser.New()
-	parsed, err := parseAllPosts(p, "/nonexistent/path")
+	parsed, err := parseAllPosts(p, "/nonexistent/path", nil)
 	if err != nil {
 		t.Fatalf("parseAllPosts() should not error on non-existent dir: %v", err)
 	}
@@ -580,3 +870,41 @@ func TestRenderer_Integration(t *testing.T) {
 		t.Error("Rendered HTML doesn't contain post content")
 	}
 }
+
+// TestRenderer_PageCache tests that content templates are parsed once and reused
+func TestRenderer_PageCache(t *testing.T) {
+	templatesDir := t.TempDir()
+
+	baseTemplate := `<html><body>{{template "posts" .}}</body></html>`
+	if err := os.WriteFile(filepath.Join(templatesDir, "base.html"), []byte(baseTemplate), 0600); err != nil {
+		t.Fatal(err)
+	}
+
+	postTemplate := `{{define "posts"}}<h1>{{.Post.Title}}</h1>{{end}}`
+	if err := os.WriteFile(filepath.Join(templatesDir, "post.html"), []byte(postTemplate), 0600); err != nil {
+		t.Fatal(err)
+	}
+
+	r, err := newRenderer(templatesDir)
+	if err != nil {
+		t.Fatalf("newRenderer() failed: %v", err)
+	}
+
+	first, err := r.page("post.html")
+	if err != nil {
+		t.Fatalf("page() failed: %v", err)
+	}
+
+	second, err := r.page("post.html")
+	if err != nil {
+		t.Fatalf("page() failed: %v", err)
+	}
+
+	if first != second {
+		t.Error("page() re-parsed post.html, want cached template")
+	}
+
+	if _, err := r.page("missing.html"); err == nil {
+		t.Error("page() succeeded for missing template, want error")
+	}
+}